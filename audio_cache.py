@@ -0,0 +1,171 @@
+"""
+Audio Cache for Spelling Game
+Keeps synthesized speech on disk so repeated utterances skip synthesis.
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+
+class AudioCache:
+    """Content-addressed disk cache of audio clips with a size cap.
+
+    Clips are keyed by a hash of (engine version, voice, text). When the
+    cache grows past max_bytes the least recently used clips are removed;
+    a clip's modification time records its last use across sessions.
+    """
+
+    def __init__(self, directory="tts_cache", max_bytes=100 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = None  # key -> size, least recently used first
+        self._total_bytes = 0
+
+    @staticmethod
+    def make_key(voice, text, engine_version):
+        """Return the cache key for an utterance."""
+        data = f"{engine_version}\0{voice}\0{text}".encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.mp3")
+
+    def _load_entries(self):
+        """Scan the cache directory once, oldest clips first."""
+        if self._entries is not None:
+            return
+        found = []
+        if os.path.isdir(self.directory):
+            for root, _dirs, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(".mp3"):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(root, name))
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, name[:-4], stat.st_size))
+        found.sort()
+        self._entries = OrderedDict((key, size) for _mtime, key, size in found)
+        self._total_bytes = sum(self._entries.values())
+
+    def get(self, key):
+        """Return the path of a cached clip and mark it used, or None."""
+        with self._lock:
+            self._load_entries()
+            if key not in self._entries:
+                return None
+            path = self._path(key)
+            try:
+                os.utime(path)
+            except OSError:
+                # Removed behind our back, e.g. by another game instance.
+                self._total_bytes -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return path
+
+    def read(self, key):
+        """Return the bytes of a cached clip and mark it used, or None."""
+        path = self.get(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, key, data):
+        """Store the bytes of a clip in the cache and return its path."""
+        tmp_path = self.reserve_path(key)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            return self.commit(key, tmp_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def reserve_path(self, key):
+        """Return a temporary path in the cache to write a new clip to."""
+        directory = os.path.dirname(self._path(key))
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"{key}.{uuid.uuid4().hex}.tmp")
+
+    def commit(self, key, tmp_path):
+        """Move a clip written to a reserved path into the cache."""
+        path = self._path(key)
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self._lock:
+            self._load_entries()
+            self._total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._total_bytes += size
+            self._evict()
+        return path
+
+    def _evict(self):
+        """Remove least recently used clips until the cache fits its cap."""
+        for key in list(self._entries):
+            if self._total_bytes <= self.max_bytes or len(self._entries) <= 1:
+                break
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Still open for playback (Windows); try again next time.
+                continue
+            self._total_bytes -= self._entries.pop(key)
+
+
+class AudioPack:
+    """Read-mostly directory of prebuilt clips, one folder per voice.
+
+    Built offline by build_audio_pack.py. Clips are keyed by voice and text
+    only, so a pack keeps working when the TTS engine is upgraded.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, voice, text):
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, voice, key[:2], f"{key}.mp3")
+
+    def __contains__(self, clip):
+        voice, text = clip
+        return os.path.exists(self._path(voice, text))
+
+    def read(self, voice, text):
+        """Return the bytes of the clip for text in voice, or None."""
+        try:
+            with open(self._path(voice, text), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def add(self, voice, text, data):
+        """Store a clip, replacing any existing one atomically."""
+        path = self._path(voice, text)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
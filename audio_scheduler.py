@@ -0,0 +1,374 @@
+"""
+Audio Scheduler for Spelling Game
+Owns the audio device and decides when speech and sound effects play.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+from sound_effects import SoundEffects
+
+try:
+    import pygame
+
+    PYGAME_AVAILABLE = True
+except Exception:
+    pygame = None
+    PYGAME_AVAILABLE = False
+
+
+# Mixer settings: a small buffer keeps the delay before a sound is heard low.
+MIXER_FREQUENCY = 44100
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+# Speech volume while a sound effect plays over it
+DUCK_VOLUME = 0.3
+# Longest wait for the decoder to drain after a clip's computed end time.
+PLAYBACK_DRAIN_TIMEOUT = 0.5
+# Audio buffered before a clip that is still arriving starts, or restarts
+# after running out (Edge TTS sends 48 kbit/s MP3, so about half a second).
+START_BUFFER_BYTES = 3072
+# Give up on a stalled clip after this long without new audio.
+STREAM_TIMEOUT = 30
+# How often to check whether a clip that is still arriving has completed
+STREAM_CHECK_INTERVAL = 0.05
+# How often to check whether a clip waiting to start has buffered enough
+BUFFER_CHECK_INTERVAL = 0.01
+# How often to check whether the decoder has drained
+DRAIN_CHECK_INTERVAL = 0.005
+
+# Layer III bitrates in kbit/s by bitrate index, for MPEG-1 and MPEG-2/2.5
+_MP3_BITRATES = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates in Hz by sample rate index, for MPEG-1, MPEG-2 and MPEG-2.5
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _mp3_first_frame(data):
+    """Return the offset of the first frame header in MP3 data, or None."""
+    offset = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        offset = 10 + size + (10 if data[5] & 0x10 else 0)
+    while offset + 3 < len(data):
+        if data[offset] == 0xFF and data[offset + 1] & 0xE0 == 0xE0:
+            return offset
+        offset += 1
+    return None
+
+
+def _mp3_frame(data, offset):
+    """Return (bitrate in kbit/s, length in bytes) of the frame at offset, or None."""
+    if offset + 3 >= len(data):
+        return None
+    if data[offset] != 0xFF or data[offset + 1] & 0xE0 != 0xE0:
+        return None
+    version = (data[offset + 1] >> 3) & 0x03
+    layer = (data[offset + 1] >> 1) & 0x03
+    if version == 1 or layer != 1:
+        return None  # Reserved version, or not Layer III
+    bitrates = _MP3_BITRATES[3 if version == 3 else 2]
+    index = data[offset + 2] >> 4
+    rate_index = (data[offset + 2] >> 2) & 0x03
+    if not 0 < index < len(bitrates) or rate_index == 3:
+        return None
+    padding = (data[offset + 2] >> 1) & 0x01
+    # 1152 samples per frame for MPEG-1, 576 otherwise
+    samples = 1152 if version == 3 else 576
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    length = samples // 8 * bitrates[index] * 1000 // sample_rate + padding
+    return bitrates[index], length
+
+
+def mp3_duration(data):
+    """Return the duration in seconds of constant-bitrate MP3 data, or None."""
+    offset = _mp3_first_frame(data)
+    frame = None if offset is None else _mp3_frame(data, offset)
+    if frame is None:
+        return None
+    return (len(data) - offset) * 8 / (frame[0] * 1000)
+
+
+def mp3_frame_start(data, position):
+    """Return the offset of the last MP3 frame starting at or before position.
+
+    Returns 0 if there is no frame header before position.
+    """
+    start = 0
+    offset = _mp3_first_frame(data)
+    while offset is not None and offset <= position:
+        frame = _mp3_frame(data, offset)
+        if frame is None:
+            break
+        start = offset
+        offset += frame[1]
+    return start
+
+
+class _Speech:
+    """A speech clip waiting for or playing on the music stream."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.done = threading.Event()
+        self.reader = None  # reader the decoder is playing from
+        self.offset = 0  # where in the stream the reader started
+        self.started = None
+        self.end = None  # computed end time, once all audio has arrived
+        self.drain_deadline = None
+        self._size = 0
+        self._grew_at = time.monotonic()
+
+    def buffered(self, start):
+        """Return True if enough audio from byte start on has arrived to play."""
+        return self.stream.complete or len(self.stream) >= start + START_BUFFER_BYTES
+
+    def stalled(self, now):
+        """Return True if no audio has arrived for STREAM_TIMEOUT."""
+        size = len(self.stream)
+        if size != self._size:
+            self._size = size
+            self._grew_at = now
+        return now - self._grew_at >= STREAM_TIMEOUT
+
+    def finish(self):
+        if self.reader is not None:
+            self.reader.end()
+        self.done.set()
+
+
+class AudioScheduler:
+    """Single owner of the pygame mixer for speech and sound effects.
+
+    A scheduler thread opens the device once and then takes commands from
+    one queue; no other code touches the mixer. Speech plays on the music
+    stream, one clip at a time in the order requested, and effects play on
+    their reserved channels. Timing guarantees:
+
+    - an effect starts as soon as its command is taken off the queue;
+    - speech never starts while an effect is playing, so a feedback sound
+      never overlaps the start of the next prompt;
+    - an effect that starts during speech ducks the speech to DUCK_VOLUME
+      until the effect ends.
+
+    Clips that are still arriving start once START_BUFFER_BYTES are in. The
+    decoder reads them in the audio callback, so reads never wait: when the
+    audio runs out, playback stops and this thread restarts it from the
+    same frame once more has arrived.
+
+    sound_dir is the folder of effects to preload, or None for none.
+    """
+
+    def __init__(self, sound_dir="sounds", duck_volume=DUCK_VOLUME):
+        self.effects = SoundEffects(sound_dir) if sound_dir else None
+        self.duck_volume = duck_volume
+        self._commands = queue.Queue()
+        self._ready = threading.Event()
+        self._available = False
+        self._speech = None  # clip holding the music stream
+        self._waiting = deque()  # clips queued behind it
+        self._effects_end = 0.0  # when the last effect started finishes
+        self._ducked = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def wait_until_ready(self, timeout=None):
+        """Wait for the device to open; return True if audio can be played."""
+        self._ready.wait(timeout)
+        return self._available
+
+    def play_effect(self, name):
+        """Play a sound effect as soon as possible."""
+        self._commands.put(("effect", name))
+
+    def play_speech(self, stream):
+        """Queue an AudioStream to be spoken.
+
+        Returns an Event that is set once the clip has finished playing or
+        was stopped.
+        """
+        speech = _Speech(stream)
+        self._commands.put(("speech", speech))
+        return speech.done
+
+    def stop_speech(self):
+        """Stop the clip that is playing and drop any queued clips."""
+        self._commands.put(("stop", None))
+
+    def shutdown(self, timeout=2):
+        """Stop all audio, close the device and end the scheduler thread."""
+        self._commands.put(("shutdown", None))
+        self._thread.join(timeout)
+
+    def _open(self):
+        """Open the audio device and preload the sound effects."""
+        if not PYGAME_AVAILABLE:
+            print("pygame not available for audio playback")
+            return
+        try:
+            pygame.mixer.init(
+                frequency=MIXER_FREQUENCY,
+                size=-16,
+                channels=MIXER_CHANNELS,
+                buffer=MIXER_BUFFER,
+            )
+        except Exception as e:
+            print(f"Audio device error: {e}")
+            return
+        self._available = True
+        if self.effects is not None:
+            self.effects.load()
+
+    def _run(self):
+        """Scheduler thread: run commands and keep playback on schedule."""
+        self._open()
+        self._ready.set()
+        while True:
+            try:
+                command, argument = self._commands.get(timeout=self._next_wake())
+            except queue.Empty:
+                command, argument = None, None
+            if command == "shutdown":
+                break
+            try:
+                if command == "effect":
+                    self._start_effect(argument)
+                elif command == "speech":
+                    self._waiting.append(argument)
+                elif command == "stop":
+                    self._stop_speech()
+                self._update()
+            except Exception as e:
+                print(f"Audio scheduler error: {e}")
+        self._stop_speech()
+        if self._available:
+            pygame.mixer.quit()
+            self._available = False
+
+    def _next_wake(self):
+        """Return how long the thread may sleep before _update() has work."""
+        now = time.monotonic()
+        wakes = []
+        if self._effects_end > now and (
+            self._ducked or (self._waiting and self._speech is None)
+        ):
+            # Unduck, or start the next clip, once the effects have finished
+            wakes.append(self._effects_end - now)
+        speech = self._speech
+        if speech is not None:
+            if speech.reader.underrun is not None:
+                # Waiting for more audio, or for the decoder to drain
+                wakes.append(BUFFER_CHECK_INTERVAL)
+            elif speech.end is None:
+                wakes.append(STREAM_CHECK_INTERVAL)
+            elif now < speech.end:
+                wakes.append(speech.end - now)
+            else:
+                wakes.append(DRAIN_CHECK_INTERVAL)
+        elif self._waiting and self._effects_end <= now:
+            # The next clip is still buffering
+            wakes.append(BUFFER_CHECK_INTERVAL)
+        if not wakes:
+            return None
+        return max(0, min(wakes))
+
+    def _start_effect(self, name):
+        if not self._available or self.effects is None:
+            return
+        length = self.effects.play(name)
+        if length is None:
+            return
+        self._effects_end = max(self._effects_end, time.monotonic() + length)
+        if self._speech is not None and not self._ducked:
+            pygame.mixer.music.set_volume(self.duck_volume)
+            self._ducked = True
+
+    def _update(self):
+        """Finish, start and unduck speech as the clock says."""
+        now = time.monotonic()
+        if self._ducked and now >= self._effects_end:
+            pygame.mixer.music.set_volume(1.0)
+            self._ducked = False
+
+        speech = self._speech
+        if speech is not None and speech.reader.underrun is not None:
+            self._resume_speech(speech, now)
+        elif speech is not None:
+            if speech.end is None and speech.stream.complete:
+                duration = mp3_duration(speech.stream.chunk(speech.offset))
+                if duration is None:
+                    # Unknown length: wait for the decoder to go idle.
+                    speech.end = now
+                else:
+                    speech.end = speech.started + duration
+                    # The decoder trails the clock by up to one audio buffer.
+                    speech.drain_deadline = speech.end + PLAYBACK_DRAIN_TIMEOUT
+            if speech.end is not None and now >= speech.end:
+                drained = not pygame.mixer.music.get_busy()
+                if drained or (
+                    speech.drain_deadline is not None and now >= speech.drain_deadline
+                ):
+                    self._speech = None
+                    speech.finish()
+
+        if not self._available:
+            while self._waiting:
+                self._waiting.popleft().finish()
+        elif self._speech is None and self._waiting and now >= self._effects_end:
+            speech = self._waiting[0]
+            if speech.buffered(0):
+                self._waiting.popleft()
+                self._start_speech(speech)
+            elif speech.stalled(now):
+                self._waiting.popleft().finish()
+
+    def _start_speech(self, speech, offset=0):
+        """Play a clip from byte offset on while the rest of it arrives."""
+        if speech.reader is not None:
+            speech.reader.end()
+        if offset >= len(speech.stream):
+            speech.finish()  # failed before any audio arrived
+            return
+        try:
+            speech.reader = speech.stream.reader(offset)
+            pygame.mixer.music.load(speech.reader, "mp3")
+            pygame.mixer.music.set_volume(self.duck_volume if self._ducked else 1.0)
+            pygame.mixer.music.play()
+        except Exception as e:
+            print(f"Speech playback error: {e}")
+            self._speech = None
+            speech.finish()
+            return
+        speech.offset = offset
+        speech.started = time.monotonic()
+        self._speech = speech
+
+    def _resume_speech(self, speech, now):
+        """Restart a clip that ran out of audio once more of it has arrived."""
+        if pygame.mixer.music.get_busy():
+            return  # still playing the audio decoded before the underrun
+        start = mp3_frame_start(speech.stream.getvalue(), speech.reader.underrun)
+        if speech.buffered(start):
+            self._start_speech(speech, start)
+        elif speech.stalled(now):
+            self._speech = None
+            speech.finish()
+
+    def _stop_speech(self):
+        if self._speech is not None:
+            if self._available:
+                pygame.mixer.music.stop()
+            self._speech.finish()
+            self._speech = None
+        while self._waiting:
+            self._waiting.popleft().finish()
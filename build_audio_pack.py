@@ -0,0 +1,152 @@
+"""
+Audio Pack Builder for Spelling Game
+Synthesizes every word and definition in a length range ahead of time, so
+the game can speak them without contacting the TTS service.
+
+Usage:
+    python build_audio_pack.py --source downloaded --min-length 5 --max-length 7
+
+Clips that are already in the pack are skipped, so an interrupted build
+picks up where it left off when run again.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from audio_cache import AudioPack
+from dictionary_manager import DictionaryManager
+from speech_synthesis import PROMPT_PREFIX, TTS_AVAILABLE, VOICES, synthesize
+
+DEFAULT_PACK_DIR = "audio_pack"
+# Print a progress line after this many clips
+PROGRESS_EVERY = 25
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build an offline audio pack of words and definitions."
+    )
+    parser.add_argument(
+        "--source",
+        choices=["fallback", "downloaded"],
+        default="fallback",
+        help="dictionary to take words from (default: fallback)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["compact", "sqlite"],
+        default="compact",
+        help="store for the downloaded dictionary; sqlite can be shared by"
+        " several programs on one machine (default: compact)",
+    )
+    parser.add_argument(
+        "--db-path",
+        help=f"SQLite dictionary file (default: {DictionaryManager.DB_FILE})",
+    )
+    parser.add_argument("--min-length", type=int, default=5)
+    parser.add_argument("--max-length", type=int, default=7)
+    parser.add_argument(
+        "--voice",
+        dest="voices",
+        action="append",
+        choices=VOICES,
+        help="voice to synthesize; repeat for several (default: all voices)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="clips synthesized at once (default: 4)",
+    )
+    parser.add_argument(
+        "--no-definitions",
+        action="store_true",
+        help="only synthesize the words",
+    )
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_PACK_DIR,
+        help=f"pack directory (default: {DEFAULT_PACK_DIR})",
+    )
+    return parser.parse_args(argv)
+
+
+def collect_clips(words, voices, include_definitions):
+    """Return the (voice, text) pairs that make up a pack."""
+    texts = [PROMPT_PREFIX]
+    for word, definition in sorted(words.items()):
+        texts.append(word)
+        if include_definitions and definition:
+            texts.append(definition)
+    # The same definition can belong to several words; synthesize it once.
+    texts = list(dict.fromkeys(texts))
+    return [(voice, text) for voice in voices for text in texts]
+
+
+async def build_pack(pack, clips, jobs):
+    """Synthesize clips into pack with jobs workers; return failures."""
+    remaining = iter(clips)
+    done = 0
+    failed = 0
+    started = time.monotonic()
+
+    async def worker():
+        nonlocal done, failed
+        # Workers share one iterator, so only jobs clips are in flight.
+        for voice, text in remaining:
+            try:
+                pack.add(voice, text, await synthesize(text, voice))
+            except Exception as e:
+                failed += 1
+                print(f"Error synthesizing {text[:40]!r} ({voice}): {e}")
+            done += 1
+            if done % PROGRESS_EVERY == 0 or done == len(clips):
+                rate = done / max(time.monotonic() - started, 1e-9)
+                print(
+                    f"{done}/{len(clips)} clips synthesized"
+                    f" ({failed} failed, {rate:.1f} clips/s)"
+                )
+
+    await asyncio.gather(*(worker() for _ in range(jobs)))
+    return failed
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not TTS_AVAILABLE:
+        print("Edge TTS not available; install edge-tts to build a pack.")
+        return 1
+    if args.min_length > args.max_length or args.jobs < 1:
+        print("Invalid length range or job count.")
+        return 1
+
+    dict_manager = DictionaryManager(
+        use_downloaded=args.source == "downloaded",
+        backend=args.backend,
+        db_path=args.db_path,
+    )
+    words = dict_manager.get_words_by_length(args.min_length, args.max_length)
+    voices = args.voices or VOICES
+    pack = AudioPack(args.output)
+
+    clips = collect_clips(words, voices, not args.no_definitions)
+    missing = [clip for clip in clips if clip not in pack]
+    print(
+        f"{len(words)} words, {len(voices)} voices: {len(clips)} clips,"
+        f" {len(clips) - len(missing)} already in {args.output}"
+    )
+    if not missing:
+        return 0
+
+    failed = asyncio.run(build_pack(pack, missing, args.jobs))
+    if failed:
+        print(f"{failed} clips failed; run again to retry them.")
+        return 1
+    print("Audio pack complete.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
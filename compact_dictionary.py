@@ -0,0 +1,354 @@
+"""
+Compact Dictionary for Spelling Game
+Reads and writes the binary, memory-mapped dictionary format.
+
+File layout (all integers little-endian uint32):
+
+    header          magic, version, word count, bucket count, section offsets
+    word offsets    word count + 1 offsets into the word blob
+    definitions     (offset, length) pairs into the definition blob
+    buckets         (word length, start, count) triples into the bucket words
+    bucket words    indices of alphabetic words, grouped by length
+    word blob       UTF-8 words, sorted
+    definition blob UTF-8 definitions
+
+Usage, to rebuild the bundled fallback dictionary from its source:
+    python compact_dictionary.py data/fallback_dictionary.json data/fallback_dictionary.bin
+"""
+
+import argparse
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping, Sequence
+
+MAGIC = b"SPLDICT\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8s9I")
+_PAIR = struct.Struct("<2I")
+_TRIPLE = struct.Struct("<3I")
+_UINT = struct.Struct("<I")
+
+
+def is_compact_dictionary(path):
+    """Return True if the file at path starts with the compact format magic."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def first_definition(details):
+    """Return the first definition from a wordset-style entry."""
+    try:
+        return details["meanings"][0].get("def", "")
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return ""
+
+
+class CompactDictionaryWriter:
+    """Collects (word, definition) pairs and writes them as a compact file.
+
+    Definitions are spooled to a temporary file as they arrive, so only the
+    word table is held in memory while a large dictionary is being built.
+    The words added so far can be looked up from other threads while the
+    writer is still being filled.
+    """
+
+    def __init__(self):
+        self._entries = {}  # word -> (definition offset, definition length)
+        self._definitions = tempfile.TemporaryFile()
+        self._definitions_size = 0
+        self._lock = threading.Lock()
+        self.length_index = {}  # word length -> alphabetic words added so far
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, word):
+        return word in self._entries
+
+    def __getitem__(self, word):
+        if word not in self._entries:
+            raise KeyError(word)
+        return {"meanings": [{"def": self.definition(word)}]}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Discard the spooled definitions."""
+        with self._lock:
+            self._definitions.close()
+
+    def add(self, word, definition):
+        """Add a word; the first definition seen for a word wins."""
+        if not word or word in self._entries:
+            return
+        data = (definition or "").encode("utf-8")
+        with self._lock:
+            self._definitions.write(data)
+        self._entries[word] = (self._definitions_size, len(data))
+        self._definitions_size += len(data)
+        if word.isalpha():
+            self.length_index.setdefault(len(word), []).append(word)
+
+    def definition(self, word, default=""):
+        """Return the definition of a word added so far, or default."""
+        entry = self._entries.get(word)
+        if entry is None:
+            return default
+        offset, length = entry
+        with self._lock:
+            if self._definitions.closed:
+                return default
+            self._definitions.flush()
+            self._definitions.seek(offset)
+            data = self._definitions.read(length)
+            self._definitions.seek(0, os.SEEK_END)
+        return data.decode("utf-8")
+
+    def write(self, path):
+        """Write the collected entries to path, replacing it atomically."""
+        words = sorted(self._entries)
+        encoded = [word.encode("utf-8") for word in words]
+
+        buckets = {}
+        for index, word in enumerate(words):
+            if word.isalpha():
+                buckets.setdefault(len(word), []).append(index)
+        lengths = sorted(buckets)
+
+        count = len(words)
+        word_offsets_pos = _HEADER.size
+        definitions_pos = word_offsets_pos + (count + 1) * _UINT.size
+        buckets_pos = definitions_pos + count * _PAIR.size
+        bucket_words_pos = buckets_pos + len(lengths) * _TRIPLE.size
+        bucket_word_count = sum(len(indices) for indices in buckets.values())
+        word_blob_pos = bucket_words_pos + bucket_word_count * _UINT.size
+        word_blob_size = sum(len(data) for data in encoded)
+        definition_blob_pos = word_blob_pos + word_blob_size
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC,
+                    VERSION,
+                    count,
+                    len(lengths),
+                    word_offsets_pos,
+                    definitions_pos,
+                    buckets_pos,
+                    bucket_words_pos,
+                    word_blob_pos,
+                    definition_blob_pos,
+                )
+            )
+
+            offset = 0
+            offsets = [0]
+            for data in encoded:
+                offset += len(data)
+                offsets.append(offset)
+            f.write(struct.pack(f"<{count + 1}I", *offsets))
+
+            for word in words:
+                f.write(_PAIR.pack(*self._entries[word]))
+
+            start = 0
+            for length in lengths:
+                f.write(_TRIPLE.pack(length, start, len(buckets[length])))
+                start += len(buckets[length])
+            for length in lengths:
+                indices = buckets[length]
+                f.write(struct.pack(f"<{len(indices)}I", *indices))
+
+            f.writelines(encoded)
+            with self._lock:
+                self._definitions.seek(0)
+                shutil.copyfileobj(self._definitions, f)
+                self._definitions.seek(0, os.SEEK_END)
+        os.replace(tmp_path, path)
+
+
+def write_compact_dictionary(path, dictionary):
+    """Write a wordset-style {word: details} dictionary to a compact file."""
+    with CompactDictionaryWriter() as writer:
+        for word, details in dictionary.items():
+            writer.add(word, first_definition(details))
+        writer.write(path)
+        return len(writer)
+
+
+class _LengthBucket(Sequence):
+    """Lazy sequence of the alphabetic words of one length."""
+
+    def __init__(self, dictionary, start, count):
+        self._dictionary = dictionary
+        self._start = start
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("bucket index out of range")
+        return self._dictionary.word_at(self.index_at(position))
+
+    def index_at(self, position):
+        """Return the dictionary index of the word at position."""
+        return self._dictionary._bucket_word_index(self._start + position)
+
+    def items(self):
+        """Yield (word, definition) pairs for every word in the bucket."""
+        dictionary = self._dictionary
+        for index in dictionary._bucket_word_indices(self._start, self._count):
+            yield dictionary.word_at(index), dictionary.definition_at(index)
+
+
+class CompactDictionary(Mapping):
+    """Read-only, memory-mapped view of a compact dictionary file.
+
+    Behaves like the wordset {word: {"meanings": [{"def": ...}]}} mapping,
+    but definitions are only decoded when a word is looked up.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            (
+                magic,
+                version,
+                self._count,
+                bucket_count,
+                self._word_offsets_pos,
+                self._definitions_pos,
+                buckets_pos,
+                self._bucket_words_pos,
+                self._word_blob_pos,
+                self._definition_blob_pos,
+            ) = _HEADER.unpack_from(self._mmap, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a compact dictionary file")
+        except Exception:
+            self._mmap.close()
+            raise
+
+        self._buckets = {}
+        for i in range(bucket_count):
+            length, start, count = _TRIPLE.unpack_from(
+                self._mmap, buckets_pos + i * _TRIPLE.size
+            )
+            self._buckets[length] = (start, count)
+
+    def close(self):
+        """Release the memory map."""
+        self._mmap.close()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self.word_at(index)
+
+    def __contains__(self, word):
+        return self.index_of(word) is not None
+
+    def __getitem__(self, word):
+        index = self.index_of(word)
+        if index is None:
+            raise KeyError(word)
+        return {"meanings": [{"def": self.definition_at(index)}]}
+
+    def word_at(self, index):
+        """Decode the word stored at index."""
+        start, end = struct.unpack_from(
+            "<2I", self._mmap, self._word_offsets_pos + index * _UINT.size
+        )
+        base = self._word_blob_pos
+        return self._mmap[base + start : base + end].decode("utf-8")
+
+    def definition_at(self, index):
+        """Decode the definition stored at index."""
+        offset, length = _PAIR.unpack_from(
+            self._mmap, self._definitions_pos + index * _PAIR.size
+        )
+        base = self._definition_blob_pos + offset
+        return self._mmap[base : base + length].decode("utf-8")
+
+    def index_of(self, word):
+        """Binary search the sorted word table; return the index or None."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.word_at(middle)
+            if candidate < word:
+                low = middle + 1
+            elif candidate > word:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def definition(self, word, default=""):
+        """Return the definition of word, or default if it is missing."""
+        index = self.index_of(word)
+        if index is None:
+            return default
+        return self.definition_at(index)
+
+    def lengths(self):
+        """Return the word lengths that have at least one alphabetic word."""
+        return sorted(self._buckets)
+
+    def words_of_length(self, length):
+        """Return a lazy sequence of the alphabetic words of a given length."""
+        start, count = self._buckets.get(length, (0, 0))
+        return _LengthBucket(self, start, count)
+
+    def _bucket_word_index(self, position):
+        return _UINT.unpack_from(
+            self._mmap, self._bucket_words_pos + position * _UINT.size
+        )[0]
+
+    def _bucket_word_indices(self, start, count):
+        return struct.unpack_from(
+            f"<{count}I", self._mmap, self._bucket_words_pos + start * _UINT.size
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert a wordset-style JSON dictionary to the compact format."
+    )
+    parser.add_argument("source", help='JSON object of {word: {"meanings": [...]}}')
+    parser.add_argument("output", help="compact dictionary file to write")
+    args = parser.parse_args(argv)
+    with open(args.source, "r", encoding="utf-8") as f:
+        dictionary = json.load(f)
+    count = write_compact_dictionary(args.output, dictionary)
+    print(f"Wrote {count} words to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
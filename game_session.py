@@ -0,0 +1,116 @@
+"""
+Game Session for Spelling Game
+The rules of one game, free of any UI, audio or file access.
+"""
+
+# Session states
+ANSWERING = "answering"  # waiting for an answer to the current word
+CHOOSING = "choosing"  # answered wrongly; try again or skip
+FINISHED = "finished"  # every question has been answered or skipped
+
+SKIPPED_ANSWER = "(skipped)"
+
+
+class GameSessionError(Exception):
+    """Raised when an action is not allowed in the session's current state."""
+
+
+class GameSession:
+    """One game of spelling questions.
+
+    words is a list of (word, definition) pairs, asked in order. A correct
+    answer scores a point and moves on; a wrong one lets the player try
+    again or skip, which records the question as incorrect. num_questions
+    is the score's denominator and defaults to the number of words.
+    """
+
+    __slots__ = (
+        "words",
+        "num_questions",
+        "question_number",
+        "score",
+        "results",
+        "state",
+    )
+
+    def __init__(self, words, num_questions=None):
+        self.words = list(words)
+        self.num_questions = len(self.words) if num_questions is None else num_questions
+        self.question_number = 0
+        self.score = 0
+        self.results = []  # List of (word, user_answer, correct) tuples
+        self.state = ANSWERING if self.words else FINISHED
+
+    @property
+    def finished(self):
+        return self.state == FINISHED
+
+    @property
+    def current_word(self):
+        """The word being asked, or "" once the game is finished."""
+        if self.state == FINISHED:
+            return ""
+        return self.words[self.question_number][0]
+
+    @property
+    def current_definition(self):
+        """The definition of the word being asked, or "" once finished."""
+        if self.state == FINISHED:
+            return ""
+        return self.words[self.question_number][1]
+
+    @property
+    def passed(self):
+        """True if at least half of the questions were answered correctly."""
+        return self.score >= self.num_questions // 2
+
+    def upcoming(self, count):
+        """Return the current and following (word, definition) pairs, up to count."""
+        if self.state == FINISHED:
+            return []
+        return self.words[self.question_number : self.question_number + count]
+
+    def submit(self, answer):
+        """Check an answer to the current word; return True if it is correct.
+
+        Answers are compared ignoring case and surrounding whitespace. A
+        correct answer moves on to the next question.
+        """
+        if self.state != ANSWERING:
+            raise GameSessionError(f"cannot submit an answer while {self.state}")
+        answer = answer.strip().lower()
+        if not answer:
+            raise GameSessionError("answer is empty")
+        word = self.words[self.question_number][0]
+        if answer != word.lower():
+            self.state = CHOOSING
+            return False
+        self.score += 1
+        self.results.append((word, answer, True))
+        self._advance()
+        return True
+
+    def try_again(self):
+        """Let the player answer the current word again after a wrong answer."""
+        if self.state != CHOOSING:
+            raise GameSessionError(f"cannot try again while {self.state}")
+        self.state = ANSWERING
+
+    def skip(self, answer=""):
+        """Record the current word as incorrect and move on.
+
+        answer is what the player had typed, if anything.
+        """
+        if self.state == FINISHED:
+            raise GameSessionError("cannot skip once the game is finished")
+        word = self.words[self.question_number][0]
+        answer = answer.strip().lower()
+        self.results.append((word, answer if answer else SKIPPED_ANSWER, False))
+        self._advance()
+
+    def _advance(self):
+        self.question_number += 1
+        if self.question_number >= len(self.words):
+            self.state = FINISHED
+        else:
+            self.state = ANSWERING
@@ -0,0 +1,412 @@
+"""
+Load Test for the Spelling Game Server
+Simulates many players against a local spelling_server instance.
+
+Usage:
+    python load_test.py --players 1000 --duration 60
+
+By default a server is started in a separate process with a stand-in
+speech backend, so the test runs offline and measures the server rather
+than Edge TTS. Each virtual player follows the desktop game's flow: start a
+game, fetch the spoken prompt, think, answer, then try again or skip after
+a wrong answer, and start a new game once the results are in.
+
+The stand-in clips name the text they "speak", which is how players know
+the word to spell. Against a server started separately with --port, they
+can only do this if that server uses the stand-in backend too.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import random
+import signal
+import sys
+import tempfile
+import time
+
+# Stand-in clips start with this marker followed by the text they speak
+STAND_IN_MARKER = b"STANDIN:"
+# Give up on a request after this long
+REQUEST_TIMEOUT = 30
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class StandInSynthesizer:
+    """Offline stand-in for Edge TTS.
+
+    Returns clip_bytes of fake audio that name their text, after a
+    lognormally distributed delay with the given median.
+    """
+
+    def __init__(self, median_latency=0.3, clip_bytes=8000):
+        self.median_latency = median_latency
+        self.clip_bytes = clip_bytes
+
+    async def __call__(self, text, voice):
+        if self.median_latency > 0:
+            await asyncio.sleep(
+                random.lognormvariate(math.log(self.median_latency), 0.4)
+            )
+        data = STAND_IN_MARKER + text.encode("utf-8") + b"\0"
+        return data + bytes(max(0, self.clip_bytes - len(data)))
+
+
+def heard_word(audio):
+    """Return the last text named by the stand-in clips in audio, or None."""
+    start = audio.rfind(STAND_IN_MARKER)
+    if start < 0:
+        return None
+    start += len(STAND_IN_MARKER)
+    end = audio.find(b"\0", start)
+    return audio[start : end if end >= 0 else len(audio)].decode("utf-8")
+
+
+def raise_open_file_limit():
+    """Allow as many open connections as the system permits."""
+    if resource is None:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+def run_server(host, port_sender, args):
+    """Child process: serve games with the stand-in speech backend."""
+    from audio_cache import AudioCache
+    from dictionary_manager import DictionaryManager
+    from spelling_server import SpeechService, SpellingServer
+
+    raise_open_file_limit()
+    # Exit normally when the parent terminates us, so the cache is removed.
+    signal.signal(signal.SIGTERM, lambda *_args: sys.exit(0))
+    cache_dir = tempfile.TemporaryDirectory(prefix="load_test_cache_")
+
+    async def serve():
+        speech = SpeechService(
+            StandInSynthesizer(args.tts_latency),
+            cache=AudioCache(cache_dir.name),
+            max_syntheses=args.max_syntheses,
+            engine_version="stand-in",
+        )
+        server = SpellingServer(
+            DictionaryManager(use_downloaded=args.downloaded), speech
+        )
+        listener = await server.start(host, 0)
+        port_sender.send(listener.sockets[0].getsockname()[1])
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    finally:
+        cache_dir.cleanup()
+
+
+class HTTPClient:
+    """Minimal keep-alive HTTP/1.1 client on asyncio streams."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._reader = None
+        self._writer = None
+
+    async def request(self, method, path, body=None):
+        """Send a request; return (status, payload bytes)."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(
+                self.host, self.port
+            )
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self._writer.write(
+            (
+                f"{method} {path} HTTP/1.1\r\n"
+                f"Host: {self.host}\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                "\r\n"
+            ).encode("latin-1")
+            + data
+        )
+        try:
+            head = await self._reader.readuntil(b"\r\n\r\n")
+            status_line, *header_lines = head.decode("latin-1").split("\r\n")
+            length = 0
+            keep_alive = True
+            for line in header_lines:
+                name, _, value = line.partition(":")
+                name = name.strip().lower()
+                if name == "content-length":
+                    length = int(value)
+                elif name == "connection":
+                    keep_alive = value.strip().lower() != "close"
+            payload = await self._reader.readexactly(length)
+        except BaseException:
+            self.close()
+            raise
+        if not keep_alive:
+            self.close()
+        return int(status_line.split(" ")[1]), payload
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+class LoadStats:
+    """Latencies and errors per endpoint."""
+
+    def __init__(self):
+        self.latencies = {}  # endpoint -> list of seconds
+        self.errors = {}  # endpoint -> count
+        self.games_finished = 0
+
+    def record(self, endpoint, seconds, ok):
+        self.latencies.setdefault(endpoint, []).append(seconds)
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def report(self, elapsed):
+        """Return the results as printable lines."""
+        total = sum(len(values) for values in self.latencies.values())
+        errors = sum(self.errors.values())
+        lines = [
+            f"{'endpoint':<12}{'requests':>10}{'errors':>9}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        ]
+        for endpoint in sorted(self.latencies):
+            values = sorted(self.latencies[endpoint])
+            p50, p95, p99 = (
+                values[min(len(values) - 1, int(q * len(values)))] * 1000
+                for q in (0.50, 0.95, 0.99)
+            )
+            lines.append(
+                f"{endpoint:<12}{len(values):>10}{self.errors.get(endpoint, 0):>9}"
+                f"{p50:>10.2f}{p95:>10.2f}{p99:>10.2f}"
+            )
+        lines.append(
+            f"{total} requests in {elapsed:.1f}s: {total / elapsed:.0f} requests/s,"
+            f" {self.games_finished} games finished,"
+            f" error rate {100 * errors / max(total, 1):.2f}%"
+        )
+        return lines
+
+
+class VirtualPlayer:
+    """Plays games like a student at the desktop game would."""
+
+    def __init__(self, client, stats, args, rng):
+        self.client = client
+        self.stats = stats
+        self.args = args
+        self.rng = rng
+
+    async def call(self, endpoint, method, path, body=None):
+        """Make a timed request; return the payload, or None on failure."""
+        started = time.perf_counter()
+        try:
+            status, payload = await asyncio.wait_for(
+                self.client.request(method, path, body), REQUEST_TIMEOUT
+            )
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            status, payload = None, None
+        ok = status is not None and status < 400
+        self.stats.record(endpoint, time.perf_counter() - started, ok)
+        return payload if ok else None
+
+    async def think(self):
+        """Pause for a lognormally distributed think time."""
+        if self.args.think_median > 0:
+            await asyncio.sleep(
+                self.rng.lognormvariate(
+                    math.log(self.args.think_median), self.args.think_sigma
+                )
+            )
+
+    async def play(self, deadline):
+        while time.monotonic() < deadline:
+            payload = await self.call(
+                "create",
+                "POST",
+                "/sessions",
+                {
+                    "num_questions": self.args.questions,
+                    "min_length": self.args.min_length,
+                    "max_length": self.args.max_length,
+                },
+            )
+            if payload is None:
+                await asyncio.sleep(1)
+                continue
+            session = json.loads(payload)
+            await self.play_game(f"/sessions/{session['id']}", session, deadline)
+
+    async def play_game(self, path, state, deadline):
+        while state["state"] != "finished" and time.monotonic() < deadline:
+            audio = await self.call("prompt", "GET", f"{path}/prompt")
+            word = heard_word(audio) if audio else None
+            if (
+                state.get("definition")
+                and self.rng.random() < self.args.definition_rate
+            ):
+                await self.call("definition", "GET", f"{path}/definition")
+            await self.think()
+
+            # Misspell some words; without a word to go on, guess.
+            answer = word or "guess"
+            if self.rng.random() >= self.args.accuracy:
+                answer += "x"
+            payload = await self.call(
+                "answer", "POST", f"{path}/answer", {"answer": answer}
+            )
+            if payload is None:
+                return
+            state = json.loads(payload)
+            if state.get("correct") or state["state"] != "choosing":
+                continue
+
+            # Wrong: try again (hearing the word once more) or move on.
+            if self.rng.random() < self.args.retry_rate:
+                payload = await self.call("try-again", "POST", f"{path}/try-again")
+            else:
+                payload = await self.call(
+                    "skip", "POST", f"{path}/skip", {"answer": answer}
+                )
+            if payload is None:
+                return
+            state = json.loads(payload)
+
+        if state["state"] == "finished":
+            self.stats.games_finished += 1
+            await self.call("state", "GET", path)
+            await self.call("delete", "DELETE", path)
+
+
+async def run_load(host, port, args):
+    """Run every virtual player until the test duration is up."""
+    stats = LoadStats()
+    started = time.monotonic()
+    deadline = started + args.ramp_up + args.duration
+    clients = []
+
+    async def start_player(index):
+        # Spread player arrivals over the ramp-up period
+        await asyncio.sleep(args.ramp_up * index / args.players)
+        client = HTTPClient(host, port)
+        clients.append(client)
+        player = VirtualPlayer(client, stats, args, random.Random(args.seed + index))
+        await player.play(deadline)
+
+    await asyncio.gather(*(start_player(i) for i in range(args.players)))
+    for client in clients:
+        client.close()
+    return stats, time.monotonic() - started
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Simulate many players against a spelling game server."
+    )
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument(
+        "--duration", type=float, default=30, help="seconds after ramp-up"
+    )
+    parser.add_argument("--ramp-up", type=float, default=5, help="seconds")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port",
+        type=int,
+        help="test a server that is already running instead of starting one",
+    )
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--min-length", type=int, default=5)
+    parser.add_argument("--max-length", type=int, default=7)
+    parser.add_argument(
+        "--think-median", type=float, default=2.0, help="median think time, seconds"
+    )
+    parser.add_argument(
+        "--think-sigma", type=float, default=0.6, help="spread of think times"
+    )
+    parser.add_argument(
+        "--accuracy", type=float, default=0.7, help="chance an answer is correct"
+    )
+    parser.add_argument(
+        "--retry-rate",
+        type=float,
+        default=0.5,
+        help="chance of trying again after a wrong answer",
+    )
+    parser.add_argument(
+        "--definition-rate",
+        type=float,
+        default=0.2,
+        help="chance of asking to hear the definition",
+    )
+    parser.add_argument(
+        "--tts-latency",
+        type=float,
+        default=0.3,
+        help="median latency of the stand-in speech backend, seconds",
+    )
+    parser.add_argument(
+        "--max-syntheses",
+        type=int,
+        default=8,
+        help="clips the local server synthesizes at once (default: 8)",
+    )
+    parser.add_argument(
+        "--downloaded",
+        action="store_true",
+        help="serve words from the downloaded dictionary",
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    raise_open_file_limit()
+
+    server_process = None
+    port = args.port
+    if port is None:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        server_process = multiprocessing.Process(
+            target=run_server,
+            args=(args.host, sender, args),
+            daemon=True,
+        )
+        server_process.start()
+        if not receiver.poll(60):
+            print("Local server did not start.")
+            server_process.terminate()
+            return 1
+        port = receiver.recv()
+        print(f"Started local server with stand-in speech on port {port}")
+
+    print(
+        f"Running {args.players} players for {args.duration:.0f}s"
+        f" after a {args.ramp_up:.0f}s ramp-up"
+    )
+    try:
+        stats, elapsed = asyncio.run(run_load(args.host, port, args))
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.join()
+    for line in stats.report(elapsed):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,8 @@ Provides a dialog for configuring game settings.
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from speech_synthesis import VOICES
+
 
 class SettingsDialog:
     """Settings dialog for game configuration."""
@@ -72,14 +74,7 @@ class SettingsDialog:
             textvariable=self.voice_var,
             width=18,
             state="readonly",
-            values=[
-                "en-GB-SoniaNeural",
-                "en-GB-RyanNeural",
-                "en-US-AriaNeural",
-                "en-US-GuyNeural",
-                "en-AU-NatashaNeural",
-                "en-AU-WilliamNeural",
-            ],
+            values=VOICES,
         )
         voice_combo.grid(row=4, column=1, pady=5)
 
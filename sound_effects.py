@@ -0,0 +1,56 @@
+"""
+Sound Effects for Spelling Game
+Keeps the short feedback sounds decoded in memory on reserved mixer channels.
+"""
+
+import os
+
+try:
+    import pygame
+
+    PYGAME_AVAILABLE = True
+except Exception:
+    pygame = None
+    PYGAME_AVAILABLE = False
+
+
+class SoundEffects:
+    """Decodes the game's sound effects once and plays them on demand.
+
+    Each effect gets its own reserved pygame mixer channel, so effects never
+    steal channels from each other and playing one costs no file access or
+    decoding. The AudioScheduler owns the mixer and is the only caller.
+    """
+
+    NAMES = ("success", "error", "cheer", "boo", "woohoo")
+
+    def __init__(self, directory="sounds"):
+        self.directory = directory
+        self._sounds = {}  # name -> (pygame Sound, reserved Channel)
+
+    def _path(self, name):
+        return os.path.join(self.directory, f"{name}.mp3")
+
+    def load(self):
+        """Decode every effect into memory; the mixer must be initialized."""
+        if not PYGAME_AVAILABLE:
+            return
+        try:
+            if pygame.mixer.get_num_channels() < len(self.NAMES):
+                pygame.mixer.set_num_channels(len(self.NAMES))
+            pygame.mixer.set_reserved(len(self.NAMES))
+            for index, name in enumerate(self.NAMES):
+                sound = pygame.mixer.Sound(self._path(name))
+                self._sounds[name] = (sound, pygame.mixer.Channel(index))
+        except Exception as e:
+            print(f"Sound effects error: {e}")
+            self._sounds = {}
+
+    def play(self, name):
+        """Start an effect; return its length in seconds, or None if not loaded."""
+        loaded = self._sounds.get(name)
+        if loaded is None:
+            return None
+        sound, channel = loaded
+        channel.play(sound)
+        return sound.get_length()
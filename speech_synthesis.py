@@ -0,0 +1,42 @@
+"""
+Speech Synthesis for Spelling Game
+Edge TTS voices and synthesis, free of any audio playback, for the server
+and tools as well as the game.
+"""
+
+try:
+    import edge_tts
+
+    TTS_AVAILABLE = True
+    ENGINE_VERSION = f"edge-tts-{edge_tts.__version__}"
+except Exception:
+    edge_tts = None
+    TTS_AVAILABLE = False
+    ENGINE_VERSION = None
+
+
+# Edge TTS voices offered to players
+VOICES = [
+    "en-GB-SoniaNeural",
+    "en-GB-RyanNeural",
+    "en-US-AriaNeural",
+    "en-US-GuyNeural",
+    "en-AU-NatashaNeural",
+    "en-AU-WilliamNeural",
+]
+
+# Spoken before every word prompt; synthesized once per voice and joined to
+# a clip of the word alone.
+PROMPT_PREFIX = "Spell the word:"
+
+
+async def synthesize(text, voice):
+    """Return the MP3 audio of text spoken in voice by Edge TTS."""
+    audio = bytearray()
+    communicate = edge_tts.Communicate(text, voice)
+    async for chunk in communicate.stream():
+        if chunk["type"] == "audio":
+            audio += chunk["data"]
+    if not audio:
+        raise RuntimeError("No audio received")
+    return bytes(audio)
@@ -4,22 +4,29 @@ A simple spelling game that speaks a word, provides its definition,
 and asks you to spell it correctly.
 """
 
-import random
+import argparse
 import tkinter as tk
 from datetime import datetime
 from tkinter import messagebox, ttk
 
-import playsound3
-
+from audio_scheduler import AudioScheduler
 from dictionary_manager import DictionaryManager
+from game_session import GameSession
 from settings_dialog import SettingsDialog
-from text_to_speech import TextToSpeech
+from text_to_speech import PRIORITY_DEFINITION, PROMPT_PREFIX, TextToSpeech
+
+# Questions after the current one whose speech is synthesized in advance
+PREFETCH_QUESTIONS = 2
+# Share of a first download to wait for before games may start. The
+# dictionary arrives in alphabetical order, so earlier games would only
+# draw words from the start of the alphabet.
+EARLY_START_FRACTION = 0.5
 
 
 class SpellingGame:
     """Main spelling game class."""
 
-    def __init__(self):
+    def __init__(self, backend="compact", db_path=None):
         self.root = tk.Tk()
         self.root.title("Spelling Game")
         self.root.geometry("800x640")
@@ -73,20 +80,26 @@ class SpellingGame:
             "voice": "en-GB-SoniaNeural",
         }
 
-        # Game state
-        self.current_word = ""
+        # Game state; the rules live in GameSession, this class only shows it
+        self.session = GameSession([])
+        self.current_word = ""  # the word on screen, kept until the next loads
         self.current_definition = ""
-        self.question_number = 0
-        self.score = 0
-        self.results = []  # List of (word, user_answer, correct) tuples
-        self.word_list = []
         self.log_file = "game_log.txt"
+        self._loading_job = None
+        # Where the downloaded dictionary is served from (see DictionaryManager)
+        self.dictionary_options = {"backend": backend, "db_path": db_path}
 
         # Initialize components
         self.dict_manager = DictionaryManager(
-            use_downloaded=self.settings["use_downloaded_dict"]
+            use_downloaded=self.settings["use_downloaded_dict"],
+            background=True,
+            **self.dictionary_options,
+        )
+        self.audio = AudioScheduler()
+        self.tts = TextToSpeech(
+            voice=self.settings["voice"], pack_dir="audio_pack", scheduler=self.audio
         )
-        self.tts = TextToSpeech(voice=self.settings["voice"])
+        self.tts.warm_up()
 
         # Create UI
         self.create_menu()
@@ -96,6 +109,7 @@ class SpellingGame:
 
         # Show start frame
         self.show_start_frame()
+        self.watch_dictionary_loading()
 
     def create_menu(self):
         """Create the menu bar."""
@@ -151,19 +165,85 @@ Click "Start New Game" to begin!"""
         )
         description_label.pack(pady=(0, 50))
 
+        # Dictionary loading progress (hidden once the dictionary is ready)
+        self.loading_frame = ttk.Frame(self.start_frame)
+        self.loading_label = ttk.Label(self.loading_frame, text="Loading dictionary...")
+        self.loading_label.pack(pady=(0, 5))
+        self.loading_bar = ttk.Progressbar(self.loading_frame, length=400)
+        self.loading_bar.pack()
+
         # Start game button
-        start_btn = ttk.Button(
+        self.start_btn = ttk.Button(
             self.start_frame,
             text="Start New Game",
             command=self.start_game_from_start_screen,
             style="TButton",
         )
-        start_btn.pack(pady=(0, 20))
+        self.start_btn.pack(pady=(0, 20))
 
     def start_game_from_start_screen(self):
         """Start a new game from the start screen."""
         self.start_new_game()
 
+    def has_enough_words(self):
+        """Return True if a game can start with the words loaded so far.
+
+        While the dictionary is still downloading, games may start once
+        EARLY_START_FRACTION of it has arrived.
+        """
+        if self.dict_manager.is_ready():
+            return True
+        progress = self.dict_manager.get_progress()
+        if not progress["download_size"] or (
+            progress["bytes_downloaded"]
+            < progress["download_size"] * EARLY_START_FRACTION
+        ):
+            return False
+        available = self.dict_manager.count_words(
+            self.settings["min_length"], self.settings["max_length"]
+        )
+        return available >= self.settings["num_questions"]
+
+    def watch_dictionary_loading(self):
+        """Start polling the dictionary manager for loading progress."""
+        if self._loading_job is not None:
+            self.root.after_cancel(self._loading_job)
+        self.update_loading_progress()
+
+    def update_loading_progress(self):
+        """Show dictionary loading progress on the start screen."""
+        self._loading_job = None
+        progress = self.dict_manager.get_progress()
+        can_start = self.has_enough_words()
+        self.start_btn.config(state="normal" if can_start else "disabled")
+
+        if progress["ready"]:
+            self.loading_frame.pack_forget()
+            return
+
+        self.loading_frame.pack(before=self.start_btn, pady=(0, 20))
+        downloaded_mb = progress["bytes_downloaded"] / 1_000_000
+        if progress["download_size"]:
+            self.loading_bar.config(
+                mode="determinate",
+                maximum=progress["download_size"],
+                value=progress["bytes_downloaded"],
+            )
+            total_mb = progress["download_size"] / 1_000_000
+            size_text = f"{downloaded_mb:.1f} / {total_mb:.1f} MB"
+        else:
+            self.loading_bar.config(mode="indeterminate")
+            self.loading_bar.step(2)
+            size_text = f"{downloaded_mb:.1f} MB"
+        text = (
+            f"Loading dictionary: {size_text}, "
+            f"{progress['entries_parsed']:,} words parsed"
+        )
+        if can_start:
+            text += "\nGames use the words loaded so far (early in the alphabet)"
+        self.loading_label.config(text=text)
+        self._loading_job = self.root.after(100, self.update_loading_progress)
+
     def create_game_frame(self):
         """Create the main game interface."""
         self.game_frame = ttk.Frame(self.root, padding="30")
@@ -315,24 +395,20 @@ Click "Start New Game" to begin!"""
 
         # Update final score
         self.final_score_label.config(
-            text=f"Your Score: {self.score} / {self.settings['num_questions']}"
+            text=f"Your Score: {self.session.score} / {self.session.num_questions}"
         )
 
         # Log the game result
         self.log_game_result()
 
-        if self.score >= self.settings["num_questions"] // 2:
-            playsound3.playsound(
-                "sounds/cheer.mp3", block=False
-            )  # Positive finished sound
+        if self.session.passed:
+            self.audio.play_effect("cheer")  # Positive finished sound
         else:
-            playsound3.playsound(
-                "sounds/boo.mp3", block=False
-            )  # Negative finished sound
+            self.audio.play_effect("boo")  # Negative finished sound
 
         # Populate results list
         self.results_listbox.delete(0, tk.END)
-        for i, (word, user_answer, correct) in enumerate(self.results, 1):
+        for i, (word, user_answer, correct) in enumerate(self.session.results, 1):
             status = "✓" if correct else "✗"
             if correct:
                 self.results_listbox.insert(tk.END, f"{i}. {status} {word}")
@@ -351,34 +427,44 @@ Click "Start New Game" to begin!"""
             old_voice = self.settings.get("voice", "en-GB-SoniaNeural")
             self.settings = dialog.result
             if self.settings["use_downloaded_dict"] != old_use_downloaded:
+                self.dict_manager.stop()
                 self.dict_manager = DictionaryManager(
-                    use_downloaded=self.settings["use_downloaded_dict"]
+                    use_downloaded=self.settings["use_downloaded_dict"],
+                    background=True,
+                    **self.dictionary_options,
                 )
+            self.watch_dictionary_loading()
             if self.settings["voice"] != old_voice:
-                self.tts = TextToSpeech(voice=self.settings["voice"])
+                self.tts.cancel()
+                self.tts.voice = self.settings["voice"]
 
     def start_new_game(self):
         """Start a new game."""
-        self.question_number = 0
-        self.score = 0
-        self.results = []
+        if not self.has_enough_words():
+            # Still loading; the start screen shows progress and enables
+            # "Start New Game" once enough words are available.
+            self.show_start_frame()
+            return
 
         # Get words for this game
-        available_words = self.dict_manager.get_words_by_length(
+        available_words = self.dict_manager.count_words(
             self.settings["min_length"], self.settings["max_length"]
         )
 
-        if len(available_words) < self.settings["num_questions"]:
+        if available_words < self.settings["num_questions"]:
             messagebox.showwarning(
                 "Warning",
-                f"Only {len(available_words)} words available for selected length range. "
+                f"Only {available_words} words available for selected length range. "
                 "Consider adjusting settings.",
             )
 
         # Select random words
-        word_items = list(available_words.items())
-        random.shuffle(word_items)
-        self.word_list = word_items[: self.settings["num_questions"]]
+        word_list = self.dict_manager.select_words(
+            self.settings["min_length"],
+            self.settings["max_length"],
+            self.settings["num_questions"],
+        )
+        self.session = GameSession(word_list, self.settings["num_questions"])
 
         # Show game frame and load first question
         self.show_game_frame()
@@ -386,19 +472,22 @@ Click "Start New Game" to begin!"""
 
     def load_next_question(self):
         """Load the next question."""
-        if self.question_number >= len(self.word_list):
+        # Anything still queued was for the previous word
+        self.tts.cancel()
+
+        session = self.session
+        if session.finished:
             self.show_results_frame()
             return
 
-        self.current_word, self.current_definition = self.word_list[
-            self.question_number
-        ]
+        self.current_word = session.current_word
+        self.current_definition = session.current_definition
 
         # Update UI
         self.progress_label.config(
-            text=f"Question {self.question_number + 1} of {len(self.word_list)}"
+            text=f"Question {session.question_number + 1} of {len(session.words)}"
         )
-        self.score_label.config(text=f"Score: {self.score}")
+        self.score_label.config(text=f"Score: {session.score}")
         self.definition_label.config(text=self.current_definition)
         self.feedback_label.config(text="")
 
@@ -414,21 +503,32 @@ Click "Start New Game" to begin!"""
         self.word_entry.bind("<Return>", lambda e: self.submit_answer())
 
         # Speak the word after a short delay
+        self.prefetch_questions()
         self.root.after(300, self.speak_word)
 
+    def prefetch_questions(self):
+        """Synthesize speech for the current and next few questions early."""
+        upcoming = self.session.upcoming(1 + PREFETCH_QUESTIONS)
+        # Word prompts first: they are always spoken, definitions only on request.
+        texts = [PROMPT_PREFIX] + [word for word, _definition in upcoming]
+        texts += [definition for _word, definition in upcoming if definition]
+        self.tts.prefetch(texts)
+
     def speak_word(self):
         """Speak the current word."""
-        self.tts.speak(f"Spell the word: {self.current_word}")
+        self.tts.speak_prompt(self.current_word)
         self.word_entry.focus()
 
     def speak_definition(self):
         """Speak the current definition."""
         if self.current_definition:
-            self.tts.speak(self.current_definition)
+            self.tts.speak(self.current_definition, PRIORITY_DEFINITION)
         self.word_entry.focus()
 
     def try_again(self):
         """Reset the form and replay the word."""
+        self.session.try_again()
+
         # Clear entry and re-enable it
         self.word_entry.config(state="normal")
         self.word_entry.delete(0, tk.END)
@@ -446,26 +546,19 @@ Click "Start New Game" to begin!"""
 
     def next_question(self):
         """Move to the next question and record as incorrect."""
-        user_answer = self.word_entry.get().strip().lower()
-
-        # Record result as incorrect
-        self.results.append(
-            (self.current_word, user_answer if user_answer else "(skipped)", False)
-        )
+        self.session.skip(self.word_entry.get())
 
         # Re-enable word entry
         self.word_entry.config(state="normal")
 
         # Move to next question
-        self.question_number += 1
         self.load_next_question()
 
     def submit_answer(self):
         """Submit the user's answer."""
-        user_answer = self.word_entry.get().strip().lower()
-        correct_answer = self.current_word.lower()
+        user_answer = self.word_entry.get()
 
-        if not user_answer:
+        if not user_answer.strip():
             messagebox.showinfo("Info", "Please enter a word.")
             return
 
@@ -473,26 +566,20 @@ Click "Start New Game" to begin!"""
         self.submit_btn.config(state="disabled")
 
         self.word_entry.unbind("<Return>")
-        is_correct = user_answer == correct_answer
+        is_correct = self.session.submit(user_answer)
 
         if is_correct:
-            self.score += 1
             self.feedback_label.config(text="✓ Correct!", foreground="green")
-            playsound3.playsound("sounds/success.mp3", block=False)  # Success sound
-
-            # Record result
-            self.results.append((self.current_word, user_answer, is_correct))
+            self.audio.play_effect("success")  # Success sound
 
             # Move to next question after a short delay
-            self.question_number += 1
-
             self.root.after(1000, self.load_next_question)
         else:
             self.feedback_label.config(
                 text="✗ Incorrect. Try again or move to the next question.",
                 foreground="red",
             )
-            playsound3.playsound("sounds/error.mp3", block=False)  # Error sound
+            self.audio.play_effect("error")  # Error sound
 
             # Hide submit button, show Try Again/Next buttons
             self.submit_btn.pack_forget()
@@ -505,7 +592,7 @@ Click "Start New Game" to begin!"""
         """Log the game result to a file."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = (
-            f"{timestamp} - Score: {self.score}/{self.settings['num_questions']}\n"
+            f"{timestamp} - Score: {self.session.score}/{self.session.num_questions}\n"
         )
         try:
             with open(self.log_file, "a") as f:
@@ -555,9 +642,30 @@ Click "Start New Game" to begin!"""
 
     def run(self):
         """Run the game."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.tts.shutdown()
+            self.audio.shutdown()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Play the spelling game.")
+    parser.add_argument(
+        "--backend",
+        choices=["compact", "sqlite"],
+        default="compact",
+        help="store for the downloaded dictionary; sqlite can be shared by"
+        " several programs on one machine (default: compact)",
+    )
+    parser.add_argument(
+        "--db-path",
+        help=f"SQLite dictionary file (default: {DictionaryManager.DB_FILE})",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    game = SpellingGame()
+    args = parse_args()
+    game = SpellingGame(backend=args.backend, db_path=args.db_path)
     game.run()
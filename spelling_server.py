@@ -0,0 +1,463 @@
+"""
+Spelling Game Server
+Hosts many concurrent spelling games over HTTP for a whole classroom.
+
+Usage:
+    python spelling_server.py --port 8080
+
+Every session follows the same rules as the desktop game (see GameSession).
+All sessions share one DictionaryManager and one speech cache.
+
+Endpoints (JSON unless noted):
+
+    POST   /sessions                  start a game; body may set
+                                      num_questions, min_length, max_length
+                                      and voice (one of VOICES)
+    GET    /sessions/<id>             current state
+    POST   /sessions/<id>/answer      body {"answer": "..."}
+    POST   /sessions/<id>/try-again   answer the current word again
+    POST   /sessions/<id>/skip        body {"answer": "..."} is optional
+    GET    /sessions/<id>/prompt      "Spell the word: ..." as audio/mpeg
+    GET    /sessions/<id>/definition  the current definition as audio/mpeg
+    DELETE /sessions/<id>             end a game
+    GET    /health                    session count
+"""
+
+import argparse
+import asyncio
+import json
+import secrets
+import sys
+import time
+from http import HTTPStatus
+
+from audio_cache import AudioCache, AudioPack
+from dictionary_manager import DictionaryManager
+from game_session import GameSession, GameSessionError
+from speech_synthesis import ENGINE_VERSION, PROMPT_PREFIX, VOICES, synthesize
+
+DEFAULT_VOICE = "en-GB-SoniaNeural"
+# Sessions idle for longer than this are removed
+SESSION_TIMEOUT = 60 * 60
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 64 * 1024
+# Close keep-alive connections that stay silent for this long
+KEEP_ALIVE_TIMEOUT = 60
+
+
+class HTTPError(Exception):
+    """An error to report to the client with an HTTP status."""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class SpeechService:
+    """Speech synthesis shared by every session on the server.
+
+    Clips come from the read-only AudioPack first, then the AudioCache;
+    otherwise synthesize(text, voice) is awaited, with at most
+    max_syntheses running at once. Concurrent requests for the same clip
+    share one lookup and synthesis, and disk access runs off the event
+    loop. Any coroutine function returning MP3 bytes can stand in for Edge
+    TTS; give it its own engine_version so its clips are cached separately.
+    """
+
+    def __init__(
+        self,
+        synthesize=synthesize,
+        cache=None,
+        pack=None,
+        max_syntheses=8,
+        engine_version=ENGINE_VERSION,
+    ):
+        self._synthesize = synthesize
+        self.cache = cache
+        self.pack = pack
+        self.engine_version = engine_version
+        self._slots = asyncio.Semaphore(max_syntheses)
+        self._inflight = {}  # cache key -> synthesis task
+        self._prefixes = {}  # voice -> PROMPT_PREFIX clip
+
+    async def clip(self, text, voice):
+        """Return the MP3 bytes of text spoken in voice."""
+        key = AudioCache.make_key(voice, text, self.engine_version)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load_clip(key, text, voice))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _task: self._inflight.pop(key, None))
+        # A client that disconnects must not cancel a clip others wait for.
+        return await asyncio.shield(task)
+
+    async def prompt(self, word, voice):
+        """Return PROMPT_PREFIX followed by word as one MP3 clip."""
+        prefix = self._prefixes.get(voice)
+        if prefix is None:
+            prefix, clip = await asyncio.gather(
+                self.clip(PROMPT_PREFIX, voice), self.clip(word, voice)
+            )
+            self._prefixes[voice] = prefix
+        else:
+            clip = await self.clip(word, voice)
+        return prefix + clip
+
+    async def _load_clip(self, key, text, voice):
+        """Read a clip from the pack or cache, or synthesize it.
+
+        File access runs in the default executor, so a slow disk never
+        holds up the other sessions.
+        """
+        loop = asyncio.get_running_loop()
+        if self.pack is not None:
+            data = await loop.run_in_executor(None, self.pack.read, voice, text)
+            if data is not None:
+                return data
+        if self.cache is not None:
+            data = await loop.run_in_executor(None, self.cache.read, key)
+            if data is not None:
+                return data
+        async with self._slots:
+            data = await self._synthesize(text, voice)
+        if self.cache is not None:
+            try:
+                await loop.run_in_executor(None, self.cache.put, key, data)
+            except OSError as e:
+                print(f"Speech cache error: {e}")
+        return data
+
+
+class _HostedSession:
+    """A GameSession plus what the server needs to know about it."""
+
+    __slots__ = ("game", "voice", "last_used")
+
+    def __init__(self, game, voice):
+        self.game = game
+        self.voice = voice
+        self.last_used = time.monotonic()
+
+
+class SpellingServer:
+    """Asyncio HTTP/1.1 server hosting many GameSessions.
+
+    Connections are kept alive between requests. Game actions are handled
+    directly on the event loop, so only speech synthesis ever waits.
+    """
+
+    def __init__(self, dict_manager, speech, session_timeout=SESSION_TIMEOUT):
+        self.dict_manager = dict_manager
+        self.speech = speech
+        self.session_timeout = session_timeout
+        self.sessions = {}  # session id -> _HostedSession
+        self._handlers = set()  # tasks serving open connections
+        self._server = None
+        self._reaper = None
+
+    async def start(self, host="127.0.0.1", port=8080):
+        """Start listening; return the asyncio Server."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        self._reaper = asyncio.ensure_future(self._reap_sessions())
+        return self._server
+
+    async def close(self):
+        """Stop accepting connections, close open ones and stop reaping."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+
+    async def _reap_sessions(self):
+        """Periodically remove sessions nobody has used for a while."""
+        while True:
+            await asyncio.sleep(min(60, self.session_timeout))
+            cutoff = time.monotonic() - self.session_timeout
+            for session_id, hosted in list(self.sessions.items()):
+                if hosted.last_used < cutoff:
+                    del self.sessions[session_id]
+
+    async def _handle_connection(self, reader, writer):
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(
+                        reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT
+                    )
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                    break
+                keep_alive = await self._handle_request(head, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.LimitOverrunError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass  # the server is closing
+        finally:
+            self._handlers.discard(handler)
+            writer.close()
+
+    async def _handle_request(self, head, reader, writer):
+        """Answer one request; return True if the connection stays open."""
+        keep_alive = False
+        try:
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, version = request_line.split(" ")
+            headers = {}
+            for line in header_lines:
+                if line:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+            connection = headers.get("connection", "").lower()
+            if version == "HTTP/1.1":
+                keep_alive = connection != "close"
+            else:
+                keep_alive = connection == "keep-alive"
+
+            if "transfer-encoding" in headers:
+                # Bodies must be sent with Content-Length; the chunk framing
+                # would otherwise be read as the next request.
+                keep_alive = False
+                raise HTTPError(
+                    HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding is not supported"
+                )
+            length = int(headers.get("content-length", 0))
+            if not 0 <= length <= MAX_BODY_SIZE:
+                keep_alive = False
+                raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "body too large")
+            body = await reader.readexactly(length) if length else b""
+
+            status, content_type, payload = await self.route(
+                method, target.split("?", 1)[0], body
+            )
+        except HTTPError as e:
+            status, content_type, payload = _json_response(e.status, {"error": str(e)})
+        except ValueError:
+            keep_alive = False
+            status, content_type, payload = _json_response(
+                HTTPStatus.BAD_REQUEST, {"error": "malformed request"}
+            )
+        except asyncio.IncompleteReadError:
+            return False
+        except Exception as e:
+            print(f"Server error: {e}")
+            status, content_type, payload = _json_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "internal error"}
+            )
+
+        status = HTTPStatus(status)
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                "\r\n"
+            ).encode("latin-1")
+            + payload
+        )
+        return keep_alive
+
+    async def route(self, method, path, body):
+        """Dispatch a request; return (status, content type, payload bytes)."""
+        parts = [part for part in path.split("/") if part]
+        if parts == ["health"] and method == "GET":
+            return _json_response(HTTPStatus.OK, {"sessions": len(self.sessions)})
+        if not parts or parts[0] != "sessions" or len(parts) > 3:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "not found")
+
+        if len(parts) == 1:
+            if method != "POST":
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "use POST")
+            return self.create_session(_parse_json(body))
+
+        hosted = self.sessions.get(parts[1])
+        if hosted is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "no such session")
+        hosted.last_used = time.monotonic()
+        action = parts[2] if len(parts) == 3 else None
+
+        try:
+            if action is None and method == "GET":
+                return _json_response(HTTPStatus.OK, self.session_state(parts[1]))
+            if action is None and method == "DELETE":
+                del self.sessions[parts[1]]
+                return _json_response(HTTPStatus.OK, {"deleted": parts[1]})
+            if action == "answer" and method == "POST":
+                answer = _parse_json(body).get("answer")
+                if not isinstance(answer, str):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "answer must be a string")
+                if not answer.strip():
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "answer is empty")
+                correct = hosted.game.submit(answer)
+                state = self.session_state(parts[1])
+                state["correct"] = correct
+                return _json_response(HTTPStatus.OK, state)
+            if action == "try-again" and method == "POST":
+                hosted.game.try_again()
+                return _json_response(HTTPStatus.OK, self.session_state(parts[1]))
+            if action == "skip" and method == "POST":
+                answer = _parse_json(body).get("answer") or ""
+                if not isinstance(answer, str):
+                    raise HTTPError(HTTPStatus.BAD_REQUEST, "answer must be a string")
+                hosted.game.skip(answer)
+                return _json_response(HTTPStatus.OK, self.session_state(parts[1]))
+            if action in ("prompt", "definition") and method == "GET":
+                return await self.speech_response(hosted, action)
+        except GameSessionError as e:
+            raise HTTPError(HTTPStatus.CONFLICT, str(e))
+        raise HTTPError(HTTPStatus.NOT_FOUND, "not found")
+
+    def create_session(self, options):
+        """Start a game with freshly selected words; return its state."""
+        num_questions = _int_option(options, "num_questions", 10)
+        min_length = _int_option(options, "min_length", 5)
+        max_length = _int_option(options, "max_length", 7)
+        voice = options.get("voice", DEFAULT_VOICE)
+        if not 1 <= num_questions <= 100 or not 1 <= min_length <= max_length:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "settings out of range")
+        if voice not in VOICES:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "unknown voice")
+
+        words = self.dict_manager.select_words(min_length, max_length, num_questions)
+        if not words:
+            raise HTTPError(HTTPStatus.CONFLICT, "no words in that length range")
+        session_id = secrets.token_urlsafe(12)
+        self.sessions[session_id] = _HostedSession(
+            GameSession(words, num_questions), voice
+        )
+        return _json_response(HTTPStatus.CREATED, self.session_state(session_id))
+
+    def session_state(self, session_id):
+        """Describe a session without giving away the word being asked."""
+        game = self.sessions[session_id].game
+        state = {
+            "id": session_id,
+            "state": game.state,
+            "question_number": game.question_number,
+            "total_questions": len(game.words),
+            "num_questions": game.num_questions,
+            "score": game.score,
+            "definition": game.current_definition,
+        }
+        if game.finished:
+            state["passed"] = game.passed
+            state["results"] = [
+                {"word": word, "answer": answer, "correct": correct}
+                for word, answer, correct in game.results
+            ]
+        return state
+
+    async def speech_response(self, hosted, action):
+        game = hosted.game
+        if game.finished:
+            raise GameSessionError("the game is finished")
+        try:
+            if action == "prompt":
+                audio = await self.speech.prompt(game.current_word, hosted.voice)
+            elif game.current_definition:
+                audio = await self.speech.clip(game.current_definition, hosted.voice)
+            else:
+                raise HTTPError(HTTPStatus.NOT_FOUND, "no definition")
+        except HTTPError:
+            raise
+        except Exception as e:
+            raise HTTPError(HTTPStatus.BAD_GATEWAY, f"speech synthesis failed: {e}")
+        return HTTPStatus.OK, "audio/mpeg", audio
+
+
+def _int_option(options, name, default):
+    """Return an integer setting from a request body."""
+    value = options.get(name, default)
+    # JSON true and false decode as bools, which are ints in Python
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, f"{name} must be an integer")
+    return value
+
+
+def _parse_json(body):
+    if not body:
+        return {}
+    try:
+        data = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be JSON")
+    if not isinstance(data, dict):
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "body must be a JSON object")
+    return data
+
+
+def _json_response(status, data):
+    return status, "application/json", json.dumps(data).encode("utf-8")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve spelling games over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--downloaded",
+        action="store_true",
+        help="use the downloaded dictionary instead of the fallback",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["compact", "sqlite"],
+        default="compact",
+        help="store for the downloaded dictionary; sqlite can be shared by"
+        " several programs on one machine (default: compact)",
+    )
+    parser.add_argument(
+        "--db-path",
+        help=f"SQLite dictionary file (default: {DictionaryManager.DB_FILE})",
+    )
+    parser.add_argument("--cache-dir", default="tts_cache")
+    parser.add_argument(
+        "--pack-dir",
+        default="audio_pack",
+        help="audio pack built with build_audio_pack.py (default: audio_pack)",
+    )
+    parser.add_argument(
+        "--max-syntheses",
+        type=int,
+        default=8,
+        help="clips synthesized at once (default: 8)",
+    )
+    return parser.parse_args(argv)
+
+
+async def serve(args):
+    dict_manager = DictionaryManager(
+        use_downloaded=args.downloaded, backend=args.backend, db_path=args.db_path
+    )
+    speech = SpeechService(
+        cache=AudioCache(args.cache_dir),
+        pack=AudioPack(args.pack_dir),
+        max_syntheses=args.max_syntheses,
+    )
+    server = SpellingServer(dict_manager, speech)
+    await server.start(args.host, args.port)
+    print(f"Serving spelling games on http://{args.host}:{args.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
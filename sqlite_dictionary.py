@@ -0,0 +1,233 @@
+"""
+SQLite Dictionary for Spelling Game
+An optional on-disk dictionary store that several game instances can share.
+"""
+
+import os
+import sqlite3
+import threading
+from collections.abc import Mapping, Sequence
+
+SCHEMA_VERSION = "1"
+
+_SCHEMA = """
+CREATE TABLE words (
+    id INTEGER PRIMARY KEY,
+    word TEXT NOT NULL UNIQUE,
+    length INTEGER NOT NULL,
+    is_alpha INTEGER NOT NULL,
+    first_letter TEXT NOT NULL,
+    difficulty INTEGER NOT NULL,
+    bucket_position INTEGER
+);
+CREATE INDEX words_by_length ON words (is_alpha, length, bucket_position);
+CREATE INDEX words_by_first_letter ON words (first_letter);
+CREATE INDEX words_by_difficulty ON words (difficulty);
+CREATE TABLE definitions (
+    word_id INTEGER NOT NULL REFERENCES words (id),
+    position INTEGER NOT NULL,
+    definition TEXT NOT NULL,
+    PRIMARY KEY (word_id, position)
+);
+CREATE TABLE metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_HARD_LETTERS = set("jkqvwxyz")
+
+
+def estimate_difficulty(word):
+    """Rough 1-5 spelling difficulty from length, rare and doubled letters."""
+    word = word.lower()
+    score = len(word) / 3
+    score += sum(letter in _HARD_LETTERS for letter in word)
+    score += sum(a == b for a, b in zip(word, word[1:]))
+    return max(1, min(5, round(score / 1.5)))
+
+
+def build_sqlite_dictionary(path, items, source=""):
+    """Write unique (word, definition) pairs to a new SQLite store at path.
+
+    The store is built in a temporary file and moved into place, so other
+    processes reading the old store are never shown a half-built one.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.executescript(_SCHEMA)
+        positions = {}  # word length -> next bucket position
+        for word_id, (word, definition) in enumerate(items, 1):
+            is_alpha = word.isalpha()
+            position = None
+            if is_alpha:
+                position = positions.get(len(word), 0)
+                positions[len(word)] = position + 1
+            connection.execute(
+                "INSERT INTO words VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    word_id,
+                    word,
+                    len(word),
+                    is_alpha,
+                    word[:1].lower(),
+                    estimate_difficulty(word),
+                    position,
+                ),
+            )
+            connection.execute(
+                "INSERT INTO definitions VALUES (?, 0, ?)", (word_id, definition)
+            )
+        connection.executemany(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [("schema_version", SCHEMA_VERSION), ("source", source)],
+        )
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, path)
+
+
+def sqlite_dictionary_source(path):
+    """Return the source recorded in the store at path, or None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            rows = dict(connection.execute("SELECT key, value FROM metadata"))
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return None
+    if rows.get("schema_version") != SCHEMA_VERSION:
+        return None
+    return rows.get("source")
+
+
+class _SQLiteBucket(Sequence):
+    """Lazy sequence of the alphabetic words of one length."""
+
+    def __init__(self, dictionary, length, count):
+        self._dictionary = dictionary
+        self._length = length
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("bucket index out of range")
+        row = self._dictionary._query_one(
+            "SELECT word FROM words"
+            " WHERE is_alpha = 1 AND length = ? AND bucket_position = ?",
+            (self._length, position),
+        )
+        return row[0]
+
+    def items(self):
+        """Return (word, definition) pairs for every word in the bucket."""
+        return self._dictionary._query_all(
+            "SELECT word, definition FROM words"
+            " JOIN definitions ON definitions.word_id = words.id"
+            " AND definitions.position = 0"
+            " WHERE is_alpha = 1 AND length = ?"
+            " ORDER BY bucket_position",
+            (self._length,),
+        )
+
+
+class SQLiteDictionary(Mapping):
+    """Read-only dictionary backed by an indexed SQLite store.
+
+    Offers the same lookups as CompactDictionary, answered with indexed
+    queries instead of holding the words in memory.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = sqlite3.connect(
+            f"file:{path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        self._buckets = dict(
+            self._query_all(
+                "SELECT length, COUNT(*) FROM words"
+                " WHERE is_alpha = 1 GROUP BY length",
+                (),
+            )
+        )
+        self._count = self._query_one("SELECT COUNT(*) FROM words", ())[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _query_one(self, sql, parameters):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchone()
+
+    def _query_all(self, sql, parameters):
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        for (word,) in self._query_all("SELECT word FROM words ORDER BY word", ()):
+            yield word
+
+    def __contains__(self, word):
+        row = self._query_one("SELECT 1 FROM words WHERE word = ?", (word,))
+        return row is not None
+
+    def __getitem__(self, word):
+        rows = self._query_all(
+            "SELECT definition FROM words"
+            " JOIN definitions ON definitions.word_id = words.id"
+            " WHERE word = ? ORDER BY position",
+            (word,),
+        )
+        if not rows:
+            raise KeyError(word)
+        return {"meanings": [{"def": definition} for (definition,) in rows]}
+
+    def definition(self, word, default=""):
+        """Return the first definition of word, or default if it is missing."""
+        try:
+            return self[word]["meanings"][0]["def"]
+        except KeyError:
+            return default
+
+    def lengths(self):
+        """Return the word lengths that have at least one alphabetic word."""
+        return sorted(self._buckets)
+
+    def words_of_length(self, length):
+        """Return a lazy sequence of the alphabetic words of a given length."""
+        return _SQLiteBucket(self, length, self._buckets.get(length, 0))
+
+    def words_by_difficulty(self, difficulty, first_letter=None):
+        """Return the words with a given difficulty, optionally by first letter."""
+        if first_letter is None:
+            rows = self._query_all(
+                "SELECT word FROM words WHERE difficulty = ? ORDER BY word",
+                (difficulty,),
+            )
+        else:
+            rows = self._query_all(
+                "SELECT word FROM words"
+                " WHERE difficulty = ? AND first_letter = ? ORDER BY word",
+                (difficulty, first_letter.lower()),
+            )
+        return [word for (word,) in rows]
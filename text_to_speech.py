@@ -4,77 +4,563 @@ Handles speech synthesis using Edge TTS.
 """
 
 import asyncio
+import heapq
+import io
+import itertools
 import os
 import queue
-import tempfile
 import threading
+import time
 
-try:
-    import edge_tts
+from audio_cache import AudioCache, AudioPack
+from audio_scheduler import STREAM_TIMEOUT, AudioScheduler
+from speech_synthesis import ENGINE_VERSION, PROMPT_PREFIX, TTS_AVAILABLE, edge_tts
 
-    TTS_AVAILABLE = True
-except Exception:
-    edge_tts = None
-    TTS_AVAILABLE = False
+# Size reported for a clip that is still arriving. SDL_mixer probes the end
+# of the file for ID3v1/APE tags before playing; reads in that region get
+# zeros, which match no tag (Edge TTS clips carry no trailing tags).
+_PROVISIONAL_SIZE = 1 << 30
+_TAG_PROBE_BYTES = 1024
 
-try:
-    import pygame
+# Priority lanes, most urgent first: word prompts, definitions, then
+# background prefetching.
+PRIORITY_PROMPT = 0
+PRIORITY_DEFINITION = 1
+PRIORITY_PREFETCH = 2
+PRIORITY_NAMES = ("prompt", "definition", "prefetch")
+# Synthesis priority of the clip the player is waiting on, ahead of all lanes
+_PRIORITY_PLAYING = -1
 
-    PLAYBACK_AVAILABLE = True
-except Exception:
-    pygame = None
-    PLAYBACK_AVAILABLE = False
+# Queue item asking the player thread to wait for the audio device
+_WARM_UP = object()
+
+
+class AudioStream:
+    """In-memory MP3 clip that can be played while it is still arriving."""
+
+    def __init__(self, data=None):
+        self._data = bytearray(data or b"")
+        self._complete = data is not None
+        self.error = None
+        self.sources = ()  # streams a joined clip is copied from
+        self._condition = threading.Condition()
+
+    @property
+    def complete(self):
+        return self._complete
+
+    def __len__(self):
+        return len(self._data)
+
+    def append(self, chunk):
+        """Add audio data; wakes readers waiting for it."""
+        with self._condition:
+            self._data += chunk
+            self._condition.notify_all()
+
+    def finish(self, error=None):
+        """Mark the clip complete, or failed if error is given."""
+        with self._condition:
+            self.error = error
+            self._complete = True
+            self._condition.notify_all()
+
+    def wait_for(self, size, timeout=STREAM_TIMEOUT):
+        """Wait until size bytes have arrived or the clip is complete."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: len(self._data) >= size or self._complete, timeout
+            )
+
+    def getvalue(self):
+        """Return the audio received so far."""
+        with self._condition:
+            return bytes(self._data)
+
+    def chunk(self, start):
+        """Return the audio received so far from byte start on."""
+        with self._condition:
+            return bytes(self._data[start:])
+
+    def reader(self, start=0):
+        """Return a new file-like reader over the clip from byte start on."""
+        return _AudioStreamReader(self, start)
+
+
+def join_streams(streams, joined):
+    """Copy streams into joined one after another as their audio arrives.
+
+    Blocks until every stream is complete. Edge TTS clips of one voice share
+    a single MP3 format, so the joined frames play back without a gap.
+    """
+    for stream in streams:
+        position = 0
+        while True:
+            if not stream.wait_for(position + 1):
+                joined.finish(TimeoutError("Timed out waiting for audio"))
+                return
+            data = stream.chunk(position)
+            if data:
+                joined.append(data)
+                position += len(data)
+            elif stream.complete:
+                if stream.error is not None:
+                    joined.finish(stream.error)
+                    return
+                break
+    joined.finish()
+
+
+class _AudioStreamReader(io.RawIOBase):
+    """File-like view of an AudioStream from byte start on, as pygame expects.
+
+    The decoder reads in the audio callback, so reads never wait. A read
+    past the audio that has arrived returns end of file and records where
+    in the stream it was in underrun, for the AudioScheduler to restart
+    playback from there.
+    """
+
+    def __init__(self, stream, start=0):
+        super().__init__()
+        self._stream = stream
+        self._start = start
+        self._position = 0
+        self._ended = False
+        self.underrun = None
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def end(self):
+        """Make every later read return end of file."""
+        self._ended = True
+
+    def readinto(self, buffer):
+        if self._ended:
+            return 0
+        stream = self._stream
+        start = self._start + self._position
+        with stream._condition:
+            if not stream._complete:
+                if self._position >= _PROVISIONAL_SIZE - _TAG_PROBE_BYTES:
+                    size = max(0, min(len(buffer), _PROVISIONAL_SIZE - self._position))
+                    buffer[:size] = bytes(size)
+                    self._position += size
+                    return size
+                if len(stream._data) < start + len(buffer):
+                    self.underrun = start
+                    return 0
+            data = stream._data[start : start + len(buffer)]
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        else:
+            stream = self._stream
+            if stream.complete:
+                size = len(stream) - self._start
+            else:
+                size = _PROVISIONAL_SIZE
+            self._position = size + offset
+        return self._position
+
+    def tell(self):
+        return self._position
+
+
+class _SynthesisSlots:
+    """Limits concurrent synthesis jobs; waiting jobs are started by priority.
+
+    Used on the event loop only. Each waiting job is identified by a token
+    so a later, more urgent request for the same clip can promote it.
+    """
+
+    def __init__(self, size):
+        self._free = size
+        self._heap = []  # (priority, sequence, token)
+        self._waiting = {}  # token -> (priority, future)
+        self._sequence = itertools.count()
+
+    def request(self, priority, token):
+        """Queue a job for a slot.
+
+        Returns a future that resolves to the priority the slot was granted
+        at; the job must call release() when done with it.
+        """
+        future = asyncio.get_running_loop().create_future()
+        if self._free and not self._waiting:
+            self._free -= 1
+            future.set_result(priority)
+            return future
+        self._waiting[token] = (priority, future)
+        heapq.heappush(self._heap, (priority, next(self._sequence), token))
+        return future
+
+    def promote(self, token, priority):
+        """Move a waiting job up to priority if that is more urgent."""
+        waiting = self._waiting.get(token)
+        if waiting is not None and priority < waiting[0]:
+            self._waiting[token] = (priority, waiting[1])
+            heapq.heappush(self._heap, (priority, next(self._sequence), token))
+
+    def release(self):
+        """Hand a finished job's slot to the most urgent waiting job."""
+        while self._heap:
+            priority, _sequence, token = heapq.heappop(self._heap)
+            waiting = self._waiting.get(token)
+            if waiting is None or waiting[0] != priority:
+                continue  # stale entry left behind by promote()
+            del self._waiting[token]
+            if not waiting[1].done():
+                waiting[1].set_result(priority)
+                return
+        self._free += 1
 
 
 class TextToSpeech:
     """Queue-based TTS worker that uses Microsoft Edge TTS for speech synthesis.
 
     Uses Edge TTS for high-quality neural text-to-speech with no compilation required.
+    Synthesized clips are kept in an on-disk AudioCache (pass cache_dir=None
+    to disable it), so replays and repeated words skip the network, and
+    prefetch() fills the cache ahead of time. If the directory pack_dir
+    exists, clips found in that read-only AudioPack, built with
+    build_audio_pack.py, are used before the cache and the network.
+
+    Synthesis runs as coroutines on one long-lived event loop thread and
+    starts as soon as text is queued, with at most max_syntheses clips
+    synthesized at once; a second thread plays them in the order queued.
+    Audio is streamed into memory and the scheduler starts playing it while
+    it is still arriving; nothing but the cache touches disk.
+    Clips are played by an AudioScheduler, which can be shared with the
+    game's sound effects; otherwise the instance creates its own.
+
+    Speaking text that is already waiting in the queue is a no-op, and
+    cancel() drops everything queued and stops the clip that is playing.
+    speak_prompt() says PROMPT_PREFIX and a word as one clip, built from a
+    prefix clip synthesized once per voice and a clip of the word alone.
+
+    Work is split into priority lanes: word prompts are played and
+    synthesized before definitions, and both before prefetching; speech
+    within a lane keeps its queue order. queue_wait_stats() reports how
+    long each lane waits.
+
+    One instance is meant to live for the whole process: voice is the
+    default for requests that do not name their own, so changing it needs
+    no new worker. Call shutdown() when done to stop the threads.
     """
 
-    def __init__(self, voice="en-GB-SoniaNeural"):
+    def __init__(
+        self,
+        voice="en-GB-SoniaNeural",
+        cache_dir="tts_cache",
+        cache_max_bytes=100 * 1024 * 1024,
+        max_syntheses=3,
+        pack_dir=None,
+        scheduler=None,
+    ):
         self.engine_ready = False
+        self._owns_scheduler = scheduler is None
+        self.scheduler = scheduler or AudioScheduler(sound_dir=None)
         self.voice = voice
-        self._queue = queue.Queue()
+        self.cache = AudioCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.pack = None
+        if pack_dir and os.path.isdir(pack_dir):
+            self.pack = AudioPack(pack_dir)
+        self._inflight = {}  # cache key -> AudioStream, used on the loop only
+        self._prompt_prefixes = {}  # voice -> PROMPT_PREFIX clip, loop only
+        self._synthesis_slots = _SynthesisSlots(max_syntheses)
+        self._pending = set()  # (voice, text) queued but not yet playing
+        self._generation = 0  # bumped by cancel() to drop older queue items
+        self._pending_lock = threading.Lock()
+        self._sequence = itertools.count()  # keeps each lane in queue order
+        self._wait_stats = {name: [0, 0.0, 0.0] for name in PRIORITY_NAMES}
+        self._stats_lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._loop_thread.start()
+        self._queue = queue.PriorityQueue()
         self._worker = threading.Thread(target=self._process_queue, daemon=True)
         self._worker.start()
 
-    def speak(self, text):
-        """Enqueue text to be spoken."""
+    def speak(self, text, priority=PRIORITY_PROMPT, voice=None):
+        """Enqueue text to be spoken; its synthesis starts right away.
+
+        priority is PRIORITY_PROMPT or PRIORITY_DEFINITION, and voice
+        defaults to self.voice. Does nothing if the same text is already
+        waiting to be spoken in the same voice.
+        """
+        self._enqueue((text,), priority, voice)
+
+    def speak_prompt(self, word, priority=PRIORITY_PROMPT, voice=None):
+        """Enqueue PROMPT_PREFIX followed by word, played as one clip."""
+        self._enqueue((PROMPT_PREFIX, word), priority, voice)
+
+    def _enqueue(self, parts, priority, voice):
+        """Queue texts to be played back to back as a single clip."""
+        voice = voice or self.voice
+        pending_key = (voice, parts)
         try:
-            self._queue.put(text)
+            with self._pending_lock:
+                if pending_key in self._pending:
+                    return
+                self._pending.add(pending_key)
+                audio = None
+                if TTS_AVAILABLE or self.pack is not None:
+                    audio = self._submit(self._get_parts_audio(parts, voice, priority))
+                text = " ".join(parts)
+                item = (text, audio, pending_key, self._generation, time.monotonic())
+                self._queue.put((priority, next(self._sequence), item))
         except Exception as e:
             print(f"TTS enqueue error: {e}")
 
+    def cancel(self):
+        """Drop all queued speech and stop the clip that is playing.
+
+        Synthesis already under way still finishes into the cache, and the
+        audio device stays open for the next clip.
+        """
+        with self._pending_lock:
+            self._generation += 1
+            self._pending.clear()
+            self.scheduler.stop_speech()
+
+    def queue_wait_stats(self):
+        """Return {lane: {"count", "mean", "max"}} queue wait times in seconds.
+
+        Spoken text waits from speak() until the player takes it; prefetched
+        text waits from prefetch() until a synthesis slot is free.
+        """
+        with self._stats_lock:
+            return {
+                name: {
+                    "count": count,
+                    "mean": total / count if count else 0.0,
+                    "max": longest,
+                }
+                for name, (count, total, longest) in self._wait_stats.items()
+            }
+
+    def _record_wait(self, priority, seconds):
+        with self._stats_lock:
+            stats = self._wait_stats[PRIORITY_NAMES[priority]]
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def prefetch(self, texts, voice=None):
+        """Synthesize texts into the cache in the background without playing them."""
+        if self.cache is None or not TTS_AVAILABLE:
+            return
+        voice = voice or self.voice
+        for text in texts:
+            self._submit(self._prefetch_audio(text, voice))
+
+    def warm_up(self, prefetch_prompt=True):
+        """Prepare for the first utterance in the background.
+
+        Has the player thread wait for the audio device to open and, with
+        prefetch_prompt, synthesizes PROMPT_PREFIX, which also sets up the
+        TTS connection.
+        """
+        self._queue.put((_PRIORITY_PLAYING, next(self._sequence), _WARM_UP))
+        if prefetch_prompt:
+            self.prefetch([PROMPT_PREFIX])
+
+    def shutdown(self, timeout=2):
+        """Stop playback and synthesis and end the worker threads.
+
+        A scheduler created by this instance is shut down too. The instance
+        cannot be used afterwards.
+        """
+        self.cancel()
+        if self._loop.is_running():
+            try:
+                self._submit(self._cancel_synthesis()).result(timeout)
+            except Exception as e:
+                print(f"TTS shutdown error: {e}")
+        self._queue.put((_PRIORITY_PLAYING, next(self._sequence), None))
+        self._worker.join(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join(timeout)
+        if not self._loop_thread.is_alive():
+            self._loop.close()
+        if self._owns_scheduler:
+            self.scheduler.shutdown(timeout)
+        self.engine_ready = False
+
+    async def _cancel_synthesis(self):
+        """Cancel every synthesis job running on the event loop."""
+        tasks = [
+            task for task in asyncio.all_tasks() if task is not asyncio.current_task()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run_loop(self):
+        """Event loop thread: run synthesis coroutines for the lifetime of the worker."""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _submit(self, coroutine):
+        """Schedule a coroutine on the event loop; return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
     def _init_engine(self):
-        """Initialize pygame mixer for audio playback."""
-        if not TTS_AVAILABLE:
+        """Wait for the scheduler to open the audio device."""
+        if not TTS_AVAILABLE and self.pack is None:
             print("Edge TTS not available")
             return
-        if not PLAYBACK_AVAILABLE:
-            print("pygame not available for audio playback")
-            return
-        try:
-            pygame.mixer.init()
-            self.engine_ready = True
+        self.engine_ready = self.scheduler.wait_until_ready()
+        if self.engine_ready:
             print("Edge TTS engine initialized in worker thread")
+
+    async def _synthesize_speech(self, text, voice, stream):
+        """Async function to stream speech from Edge TTS into an AudioStream."""
+        communicate = edge_tts.Communicate(text, voice)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                stream.append(chunk["data"])
+
+    async def _get_parts_audio(self, parts, voice, priority):
+        """Return one AudioStream playing the clips for parts in order.
+
+        Returns None if any part has no clip and cannot be synthesized.
+        """
+        streams = []
+        for part in parts:
+            if part == PROMPT_PREFIX:
+                stream = await self._get_prompt_prefix(voice, priority)
+            else:
+                stream = await self._get_audio(part, voice, priority)
+            if stream is None:
+                return None
+            streams.append(stream)
+        if len(streams) == 1:
+            return streams[0]
+        joined = AudioStream()
+        joined.sources = tuple(streams)
+        self._loop.run_in_executor(None, join_streams, streams, joined)
+        return joined
+
+    async def _get_prompt_prefix(self, voice, priority):
+        """Return the PROMPT_PREFIX clip, kept in memory once synthesized."""
+        stream = self._prompt_prefixes.get(voice)
+        if stream is not None and stream.error is None:
+            return stream
+        stream = self._prompt_prefixes[voice] = await self._get_audio(
+            PROMPT_PREFIX, voice, priority
+        )
+        return stream
+
+    async def _get_audio(self, text, voice, priority=PRIORITY_PROMPT):
+        """Return an AudioStream for text, starting synthesis if needed.
+
+        Returns None if the clip is in neither the pack nor the cache and
+        Edge TTS is not available.
+        """
+        if self.pack is not None:
+            data = self.pack.read(voice, text)
+            if data is not None:
+                return AudioStream(data)
+
+        key = AudioCache.make_key(voice, text, ENGINE_VERSION)
+        stream = self._inflight.get(key)
+        if stream is not None:
+            # The same clip is already being synthesized; share it.
+            self._synthesis_slots.promote(stream, priority)
+            return stream
+
+        if self.cache is not None:
+            data = self.cache.read(key)
+            if data is not None:
+                return AudioStream(data)
+
+        if not TTS_AVAILABLE:
+            return None
+        return self._start_synthesis(key, text, voice, priority)
+
+    def _start_synthesis(self, key, text, voice, priority):
+        """Start synthesizing a clip in the background; return its AudioStream."""
+        stream = self._inflight[key] = AudioStream()
+        # Queue for a slot now, so a request for the same clip made before
+        # the job first runs can still promote it.
+        slot = self._synthesis_slots.request(priority, stream)
+        asyncio.ensure_future(self._synthesize(key, text, voice, stream, slot))
+        return stream
+
+    async def _synthesize(self, key, text, voice, stream, slot):
+        """Fill stream with synthesized speech, then store it in the cache."""
+        try:
+            requested = time.monotonic()
+            priority = await slot
+            if priority == PRIORITY_PREFETCH:
+                self._record_wait(priority, time.monotonic() - requested)
+            try:
+                await self._synthesize_speech(text, voice, stream)
+            finally:
+                self._synthesis_slots.release()
+            if not len(stream):
+                raise RuntimeError("No audio received")
+        except asyncio.CancelledError:
+            stream.finish(RuntimeError("Synthesis cancelled"))
+            raise
         except Exception as e:
-            print(f"TTS initialization error (worker): {e}")
-            self.engine_ready = False
+            stream.finish(e)
+            print(f"TTS synthesis error: {e}")
+            return
+        finally:
+            self._inflight.pop(key, None)
+        stream.finish()
+        if self.cache is not None:
+            try:
+                self.cache.put(key, stream.getvalue())
+            except OSError as e:
+                print(f"TTS cache error: {e}")
 
-    async def _synthesize_speech(self, text, output_path):
-        """Async function to synthesize speech using Edge TTS."""
-        # Use configured voice
-        communicate = edge_tts.Communicate(text, self.voice)
-        await communicate.save(output_path)
+    async def _prefetch_audio(self, text, voice):
+        """Make sure text's clip is packed, cached or being synthesized.
+
+        Only checks whether the clip exists, so warm clips cost no reads.
+        """
+        try:
+            if self.pack is not None and (voice, text) in self.pack:
+                return
+            key = AudioCache.make_key(voice, text, ENGINE_VERSION)
+            if key in self._inflight or self.cache.get(key) is not None:
+                return
+            self._start_synthesis(key, text, voice, PRIORITY_PREFETCH)
+        except Exception as e:
+            print(f"TTS prefetch error: {e}")
 
     def _process_queue(self):
         """Worker loop: initialize engine when needed and speak queued texts."""
         while True:
             try:
-                text = self._queue.get()
-                if text is None:
+                priority, _sequence, item = self._queue.get()
+                if item is None:
                     break
+                if item is _WARM_UP:
+                    if not self.engine_ready:
+                        self._init_engine()
+                    self._queue.task_done()
+                    continue
+                text, audio, pending_key, generation, queued = item
+                with self._pending_lock:
+                    if generation != self._generation:
+                        self._queue.task_done()
+                        continue
+                    self._pending.discard(pending_key)
+                self._record_wait(priority, time.monotonic() - queued)
 
                 if not self.engine_ready:
                     self._init_engine()
@@ -85,26 +571,23 @@ class TextToSpeech:
                     continue
 
                 try:
-                    # Generate speech to a temporary MP3 file
-                    with tempfile.NamedTemporaryFile(
-                        suffix=".mp3", delete=False
-                    ) as tmp_file:
-                        tmp_path = tmp_file.name
-
-                    # Run async TTS synthesis
-                    asyncio.run(self._synthesize_speech(text, tmp_path))
-
-                    # Play the audio using pygame
-                    pygame.mixer.music.load(tmp_path)
-                    pygame.mixer.music.play()
-                    while pygame.mixer.music.get_busy():
-                        pygame.time.Clock().tick(10)
-
-                    # Clean up temporary file
-                    try:
-                        os.unlink(tmp_path)
-                    except:
-                        pass
+                    stream = audio.result()
+                    if stream is None:
+                        print(f"(no engine) would speak: {text}")
+                        continue
+                    for source in stream.sources or (stream,):
+                        self._loop.call_soon_threadsafe(
+                            self._synthesis_slots.promote, source, _PRIORITY_PLAYING
+                        )
+                    # Checked under the lock cancel() stops speech with, so
+                    # a clip is never handed over after its cancel.
+                    with self._pending_lock:
+                        if generation != self._generation:
+                            continue
+                        done = self.scheduler.play_speech(stream)
+                    done.wait()
+                    if stream.error is not None:
+                        raise stream.error
 
                 except Exception as e:
                     print(f"TTS speak error: {e}")